@@ -0,0 +1,99 @@
+# Run this file with `python check_startup.py` from the repository root.
+# Exits with a non-zero status when a module takes longer than its budget to import,
+# loads a heavy dependency it should defer, or creates files or directories at import time.
+
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# (directory added to sys.path, module to import, import-time budget in seconds, modules that must stay unloaded)
+STARTUP_CHECKS = [
+    ("crew_app", "main", 0.5, ["crewai", "langchain_openai", "custom_tools", "requests"]),
+    ("mcp_services/git_service", "main", 1.5, []),
+    (".", "mcp_services.code_analysis_service.main", 1.5, ["flake8"]),
+]
+
+# Multiplies every budget, e.g. STARTUP_BUDGET_SCALE=2 on slow CI machines
+BUDGET_SCALE = float(os.getenv("STARTUP_BUDGET_SCALE", "1.0"))
+
+# Runs in an empty working directory, so anything listed afterwards (e.g. temp_repos) was created by the import
+MEASURE_SNIPPET = """
+import os, sys, time
+sys.path.insert(0, {module_dir!r})
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [name for name in {forbidden!r} if name in sys.modules]
+print(elapsed)
+print(",".join(loaded))
+print(",".join(sorted(os.listdir("."))))
+"""
+
+
+def measure_import(module_dir: str, module: str, forbidden: list) -> dict:
+    """
+    Imports a module in a fresh interpreter, from an empty working directory, and measures how long it takes.
+    Args:
+        module_dir: Directory, relative to the repository root, to add to sys.path.
+        module: The module to import.
+        forbidden: Modules that must not be loaded as a side effect of the import.
+    Returns:
+        A dictionary containing status, message, the elapsed time, the forbidden modules that were loaded
+        and the paths created in the working directory.
+    """
+    snippet = MEASURE_SNIPPET.format(
+        module_dir=os.path.join(REPO_ROOT, module_dir), module=module, forbidden=forbidden)
+    with tempfile.TemporaryDirectory() as working_dir:
+        result = subprocess.run(
+            [sys.executable, "-c", snippet],
+            cwd=working_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    if result.returncode != 0:
+        stderr_lines = result.stderr.strip().splitlines()
+        message = stderr_lines[-1] if stderr_lines else f"exited with return code {result.returncode}"
+        return {"status": "error", "message": message}
+
+    elapsed_line, loaded_line, created_line = (["", "", ""] + result.stdout.splitlines())[-3:]
+    return {
+        "status": "success",
+        "elapsed": float(elapsed_line),
+        "loaded": [name for name in loaded_line.split(",") if name],
+        "created": [name for name in created_line.split(",") if name],
+    }
+
+
+def main() -> int:
+    failures = 0
+    for module_dir, module, budget, forbidden in STARTUP_CHECKS:
+        budget *= BUDGET_SCALE
+        label = f"{module_dir}: import {module}"
+        result = measure_import(module_dir, module, forbidden)
+        if result["status"] == "error":
+            print(f"ERROR {label} failed: {result['message']}")
+            failures += 1
+            continue
+
+        problems = []
+        if result["loaded"]:
+            problems.append(f"loaded {', '.join(result['loaded'])} at import time")
+        if result["created"]:
+            problems.append(f"created {', '.join(result['created'])} at import time")
+        if result["elapsed"] > budget:
+            problems.append("exceeded its budget")
+        timing = f"took {result['elapsed']:.3f}s (budget {budget:.3f}s)"
+        if problems:
+            print(f"FAIL  {label} {timing}: {'; '.join(problems)}")
+            failures += 1
+        else:
+            print(f"OK    {label} {timing}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
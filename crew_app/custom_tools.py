@@ -3,6 +3,9 @@ import requests
 from crewai.tools import tool
 import datetime
 
+# crewai.tools is the heavy import here; main.py only imports this module
+# from get_crew(), so the cost is paid when the crew is first built.
+
 # Base URL for your Git MCP Service (should be running on port 8000)
 MCP_GIT_SERVICE_URL = os.getenv("MCP_GIT_SERVICE_URL", "http://localhost:8000/mcp")
 
@@ -66,6 +69,46 @@ class GitTools:
 
         return f"Error getting repository status: {data.get('message', 'Unknown error')}"
     
+    @tool("Get Repository Snapshot")
+    def get_repo_snapshot(repo_local_path: str, include_files: bool = False) -> str:
+        """
+        Gets a compact snapshot of a git repository in a single call: branch, HEAD, dirty state,
+        file counts per language, the Python files and the recent commits. Gitignored files are left out.
+        Use this before listing directories or reading files one by one.
+        Args:
+            repo_local_path (str): The path to the git repository
+            include_files (bool, optional): Also list every file with its size and language. Defaults to False.
+        Returns:
+            A string containing the repository snapshot
+        """
+        response = requests.post(f"{MCP_GIT_SERVICE_URL}/git/snapshot", json={
+            "repo_local_path": repo_local_path
+        })
+        response.raise_for_status()
+        data = response.json()
+        if data.get("success"):
+            snapshot = data.get("data", {})
+            languages = ", ".join(f"{name} ({count})" for name, count in snapshot.get("languages", {}).items())
+            commits = "\n".join(f"  {commit['sha']} {commit['date']} {commit['author']}: {commit['summary']}"
+                                for commit in snapshot.get("recent_commits", []))
+            summary = f"Repository snapshot for {repo_local_path}:\n" \
+                 f"Branch: {snapshot.get('branch') or 'detached HEAD'}\n" \
+                 f"HEAD: {snapshot.get('head')}\n" \
+                 f"Is dirty: {snapshot.get('is_dirty', False)}\n" \
+                 f"Files: {snapshot.get('file_count')} ({snapshot.get('total_size')} bytes)\n" \
+                 f"Languages: {languages}\n" \
+                 f"Python files: {', '.join(snapshot.get('python_files', [])) or 'none'}\n" \
+                 f"Recent commits:\n{commits}"
+            if include_files:
+                files = "\n".join(f"  {item['path']} ({item['size']} bytes, {item['language']})"
+                                  for item in snapshot.get("files", []))
+                if snapshot.get("files_truncated"):
+                    files += f"\n  ... truncated, {snapshot.get('file_count')} files in total"
+                summary += f"\nFile tree:\n{files}"
+            return summary
+
+        return f"Error getting repository snapshot: {data.get('message', 'Unknown error')}"
+
     @tool("Read File Content")
     def read_file_content(repo_local_path: str, file_path_in_repo: str) -> str:
         """
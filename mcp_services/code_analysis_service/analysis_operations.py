@@ -1,8 +1,4 @@
 import os, tempfile, subprocess
-import io
-import sys
-from contextlib import redirect_stdout, redirect_stderr
-from flake8.main.cli import main as flake8_main
 
 def analyze_python_code_style(code_content: str) -> dict:
     """
@@ -1,11 +1,57 @@
 import git 
 import os
 import shutil
+import threading
 
-# Ensure a temporary directory exists
 TEMP_REPO_DIR = "temp_repos"
-if not os.path.exists(TEMP_REPO_DIR):
-    os.makedirs(TEMP_REPO_DIR)
+
+# Snapshots of clean repositories, keyed by (absolute repo path, HEAD sha, max_commits).
+# FastAPI runs sync endpoints in a thread pool, so all access goes through the lock.
+_SNAPSHOT_CACHE = {}
+_SNAPSHOT_CACHE_LOCK = threading.Lock()
+SNAPSHOT_CACHE_MAX_ENTRIES = 32
+
+# Maximum number of entries returned in a snapshot's "files" list; counts, languages
+# and python_files always cover every file
+SNAPSHOT_MAX_FILES = 1000
+
+# File extension -> language reported in repository snapshots
+LANGUAGE_BY_EXTENSION = {
+    ".py": "Python",
+    ".ipynb": "Jupyter Notebook",
+    ".js": "JavaScript",
+    ".jsx": "JavaScript",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".java": "Java",
+    ".go": "Go",
+    ".rs": "Rust",
+    ".c": "C",
+    ".h": "C",
+    ".cpp": "C++",
+    ".hpp": "C++",
+    ".cs": "C#",
+    ".rb": "Ruby",
+    ".php": "PHP",
+    ".sh": "Shell",
+    ".html": "HTML",
+    ".css": "CSS",
+    ".md": "Markdown",
+    ".rst": "reStructuredText",
+    ".json": "JSON",
+    ".yml": "YAML",
+    ".yaml": "YAML",
+    ".toml": "TOML",
+    ".cfg": "INI",
+    ".ini": "INI",
+    ".txt": "Text",
+}
+
+def _ensure_temp_repo_dir() -> None:
+    """
+    Creates the temporary clone directory on first use instead of at import time.
+    """
+    os.makedirs(TEMP_REPO_DIR, exist_ok=True)
 
 def clone_repo(repo_url: str, branch: str = "main", local_path: str = None) -> dict:
     """
@@ -17,6 +63,7 @@ def clone_repo(repo_url: str, branch: str = "main", local_path: str = None) -> d
     Returns:
         A dictionary containing status and message.
     """
+    _ensure_temp_repo_dir()
     if not local_path:
         # Generate a unique name for the repository
         repo_name = repo_url.split("/")[-1].replace(".git", "")
@@ -212,4 +259,110 @@ def write_file_content(repo_local_path: str, file_path_in_repo: str, content: st
             "status": "error",
             "message": f"Error writing file: {str(e)}"
         }
-        
\ No newline at end of file
+
+def _list_repo_files(repo: git.Repo) -> list:
+    """
+    Lists the files git knows about: tracked files plus untracked files that are not ignored.
+    Gitignored content such as virtualenvs, node_modules or build output is left out.
+    Args:
+        repo: The git repository.
+    Returns:
+        A list of {"path", "size", "language"} dictionaries sorted by path.
+    """
+    output = repo.git.ls_files("--cached", "--others", "--exclude-standard", "-z")
+    files = []
+    for relative_path in sorted(set(path for path in output.split("\0") if path)):
+        full_path = os.path.join(repo.working_tree_dir, relative_path)
+        if not os.path.isfile(full_path):
+            continue # tracked but deleted from the working tree, or a submodule
+        extension = os.path.splitext(relative_path)[1].lower()
+        files.append({
+            "path": relative_path,
+            "size": os.path.getsize(full_path),
+            "language": LANGUAGE_BY_EXTENSION.get(extension, "Other")
+        })
+    return files
+
+def repo_snapshot(repo_local_path: str, max_commits: int = 10) -> dict:
+    """
+    Build a compact snapshot of a git repository in a single call.
+    Only tracked and untracked, non-ignored files are included, so a clean repository's file list
+    is fully determined by its HEAD; such snapshots are cached per HEAD sha. Dirty repositories
+    are always recomputed. The "files" list is capped at SNAPSHOT_MAX_FILES entries.
+    Args:
+        repo_local_path: The path to the git repository.
+        max_commits: The number of recent commits to summarize.
+    Returns:
+        status: success or error
+        message: success or error message
+        data: branch, head, dirty state, file tree, Python files, languages and recent commits
+    """
+    try:
+        repo = git.Repo(repo_local_path)
+        try:
+            branch = repo.active_branch.name
+        except TypeError:
+            branch = None # detached HEAD
+        head_sha = repo.head.commit.hexsha if repo.head.is_valid() else None
+        is_dirty = repo.is_dirty(untracked_files=True)
+
+        cache_key = (os.path.abspath(repo_local_path), head_sha, max_commits)
+        if head_sha and not is_dirty:
+            with _SNAPSHOT_CACHE_LOCK:
+                cached = _SNAPSHOT_CACHE.get(cache_key)
+            if cached is not None:
+                return {
+                    "status": "success",
+                    "message": "Repository snapshot retrieved from cache",
+                    "data": {**cached, "branch": branch}
+                }
+
+        files = _list_repo_files(repo)
+        languages = {}
+        for item in files:
+            languages[item["language"]] = languages.get(item["language"], 0) + 1
+
+        recent_commits = []
+        if head_sha:
+            for commit in repo.iter_commits(max_count=max_commits):
+                recent_commits.append({
+                    "sha": commit.hexsha[:7],
+                    "author": commit.author.name,
+                    "date": commit.committed_datetime.isoformat(),
+                    "summary": commit.summary
+                })
+
+        snapshot = {
+            "branch": branch,
+            "head": head_sha,
+            "is_dirty": is_dirty,
+            "file_count": len(files),
+            "total_size": sum(item["size"] for item in files),
+            "languages": languages,
+            "python_files": [item["path"] for item in files if item["language"] == "Python"],
+            "files": files[:SNAPSHOT_MAX_FILES],
+            "files_truncated": len(files) > SNAPSHOT_MAX_FILES,
+            "recent_commits": recent_commits,
+        }
+        if head_sha and not is_dirty:
+            with _SNAPSHOT_CACHE_LOCK:
+                if cache_key not in _SNAPSHOT_CACHE and len(_SNAPSHOT_CACHE) >= SNAPSHOT_CACHE_MAX_ENTRIES:
+                    _SNAPSHOT_CACHE.pop(next(iter(_SNAPSHOT_CACHE)))
+                _SNAPSHOT_CACHE[cache_key] = snapshot
+        return {
+            "status": "success",
+            "message": "Repository snapshot built successfully",
+            "data": snapshot
+        }
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError):
+        return {
+            "status": "error",
+            "message": f"Invalid git repository: {repo_local_path}",
+            "data": {}
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"An unexpected error occurred: {str(e)}",
+            "data": {}
+        }
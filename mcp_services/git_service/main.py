@@ -33,6 +33,10 @@ class ListContentsRequest(BaseModel):
     repo_local_path: str # Local repo path
     path_in_repo: str  = "" # Relative path within the cloned repository
 
+class RepoSnapshotRequest(BaseModel):
+    repo_local_path: str # Local repo path
+    max_commits: int = 10 # Number of recent commits to summarize
+
 class WriteFileRequest(BaseModel):
     repo_local_path: str # Local repo path
     file_path_in_repo: str # Relative path within the repository
@@ -90,6 +94,19 @@ def api_list_contents(request: ListContentsRequest):
         return {"success": True, "contents": result["contents"]}
     raise HTTPException(status_code=404, detail=result["message"])
 
+@app.post("/mcp/git/snapshot", summary="Get a compact metadata snapshot of a git repository")
+def api_repo_snapshot(request: RepoSnapshotRequest):
+    """
+    Returns branch, HEAD, dirty state, file tree, Python files and recent commits in one call.
+    """
+    print(f"Building snapshot of repository at {request.repo_local_path}...")
+    result = git_operations.repo_snapshot(
+        repo_local_path=request.repo_local_path,
+        max_commits=request.max_commits)
+    if result["status"] == "success":
+        return {"success": True, "message": result["message"], "data": result["data"]}
+    raise HTTPException(status_code=404, detail=result["message"])
+
 @app.post("/mcp/git/write_file", summary="Write content to a file in a git repository")
 def api_write_file(request: WriteFileRequest):
     """